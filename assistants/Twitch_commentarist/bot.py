@@ -14,7 +14,9 @@ import cv2
 import numpy as np
 import os
 import random
-from threading import Thread
+import time
+from collections import OrderedDict
+from threading import Lock, Thread
 
 # Get bot.py's father path
 path = pathlib.Path(__file__).parent.resolve().__str__()
@@ -24,6 +26,17 @@ config = ConfigParser()
 config.read(os.path.join(path, "..", "..", "config.ini"))
 account_fields = config["TWITCH_COMMENTARIST_CONFIG"]
 
+# Frases de relleno que se reproducen mientras el modelo genera la respuesta
+FILLER_PHRASES = [
+    "A ver, a ver...",
+    "Mmm, déjame pensar.",
+    "Vale, vale...",
+    "Uy, buena pregunta.",
+    "Espera, que esta me la sé.",
+]
+# Número máximo de nombres de espectadores con audio precalculado (se descartan los menos recientes)
+MAX_VIEWER_NAME_CLIPS = 200
+
 # Create a commands.Bot class
 class TwitchCommentarist(AI_Assistant, commands.Bot, Kokoro):
 
@@ -59,6 +72,19 @@ class TwitchCommentarist(AI_Assistant, commands.Bot, Kokoro):
                          client_secret=account_fields["client_secret"])
         # Initialize Kokoro
         Kokoro.__init__(self, language=config["VOICE"]["language"], voice=config["VOICE"]["voice"])
+
+        # Audios de relleno precalculados para enmascarar la latencia del modelo
+        self.filler_threshold = config["VOICE"].getfloat("filler_threshold", fallback=1.5)
+        self.filler_clips = []
+        for phrase in FILLER_PHRASES:
+            try:
+                self.filler_clips.append(self.generate_audio(phrase))
+            except Exception as e:
+                print(f"Error al generar el audio de relleno '{phrase}': {e}")
+        self.viewer_name_clips = OrderedDict()
+        self.viewer_name_clips_lock = Lock()
+        # Estimación del tiempo de síntesis de las respuestas (segundos). None -> sin mediciones todavía
+        self.synthesis_time_estimate = None
         
         # Inicializar variables para la ventana
         self.window_name = "AI Assistant"
@@ -141,21 +167,103 @@ class TwitchCommentarist(AI_Assistant, commands.Bot, Kokoro):
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
 
+    def _start_filler(self, author_name):
+        '''
+        Lanza en un hilo un audio de relleno precalculado si el tiempo de respuesta
+        previsto supera el umbral. Devuelve el hilo o None si no se reproduce nada.
+        '''
+        # Tiempo previsto hasta que empieza a sonar la respuesta: modelo + síntesis de voz
+        model_time = self.predicted_response_time()
+        if model_time is not None and self.synthesis_time_estimate is not None:
+            if model_time + self.synthesis_time_estimate < self.filler_threshold:
+                return None
+
+        candidates = list(self.filler_clips)
+        with self.viewer_name_clips_lock:
+            if author_name in self.viewer_name_clips:
+                self.viewer_name_clips.move_to_end(author_name)
+                candidates.append(self.viewer_name_clips[author_name])
+        # Todos los audios de relleno fallaron al generarse y no hay nombre del espectador
+        if not candidates:
+            return None
+        audio_arrays, duration_seconds = random.choice(candidates)
+
+        def play_filler():
+            self.audio_to_reproduce = (True, duration_seconds)
+            self.reproduce_audio(audio_arrays)
+
+        filler_thread = Thread(target=play_filler)
+        filler_thread.daemon = True
+        filler_thread.start()
+        return filler_thread
+
+    def _update_synthesis_time(self, elapsed: float):
+        '''
+        Actualiza la media móvil exponencial del tiempo de síntesis de las respuestas.
+        '''
+        if self.synthesis_time_estimate is None:
+            self.synthesis_time_estimate = elapsed
+        else:
+            alpha = self.RESPONSE_TIME_SMOOTHING
+            self.synthesis_time_estimate = alpha * elapsed + (1 - alpha) * self.synthesis_time_estimate
+
+    def _start_viewer_name_clip(self, author_name):
+        '''
+        Genera en un hilo el audio con el nombre del espectador y lo guarda en la caché
+        de nombres, descartando los espectadores menos recientes si se supera el límite.
+        '''
+        with self.viewer_name_clips_lock:
+            if author_name in self.viewer_name_clips:
+                self.viewer_name_clips.move_to_end(author_name)
+                return
+
+        def generate_name_clip():
+            try:
+                clip = self.generate_audio(f"{author_name}...")
+            except Exception as e:
+                print(f"Error al generar el audio del nombre '{author_name}': {e}")
+                return
+            with self.viewer_name_clips_lock:
+                self.viewer_name_clips[author_name] = clip
+                self.viewer_name_clips.move_to_end(author_name)
+                while len(self.viewer_name_clips) > MAX_VIEWER_NAME_CLIPS:
+                    self.viewer_name_clips.popitem(last=False)
+
+        name_thread = Thread(target=generate_name_clip)
+        name_thread.daemon = True
+        name_thread.start()
+
     async def event_message(self, message: Message):
         'Display messages on console'
+        filler_thread = None
         try:
             print(f"{message.author.name}: {message.content}")
+
+            # Reproducir un audio de relleno si se prevé que el modelo va a tardar
+            filler_thread = self._start_filler(message.author.name)
             response = self.send_message(f"{message.author.name}: {message.content}")
             print(f"IA: {response}")
             
             # Activar visualización de imagen durante el audio
+            start_time = time.perf_counter()
             audio_arrays, duration_seconds = self.generate_audio(response)
+            self._update_synthesis_time(time.perf_counter() - start_time)
+
+            # Precalcular en segundo plano el nombre del espectador para usarlo como relleno en sus próximos mensajes
+            self._start_viewer_name_clip(message.author.name)
+
+            if filler_thread is not None:
+                # Esperar a que termine el relleno sin apagar la imagen entre ambos audios
+                filler_thread.join()
             self.audio_to_reproduce = (True, duration_seconds)
             self.reproduce_audio(audio_arrays)
             self.audio_to_reproduce = (False, -1)
             
         except:
-            pass
+            # No dejar la imagen activa si el relleno se quedó sin respuesta
+            if filler_thread is not None:
+                filler_thread.join()
+            self.audio_to_reproduce = (False, -1)
         await super().event_message(message)
 
     @commands.command()
@@ -1,10 +1,13 @@
 from openai import OpenAI
 import os
 import platform
+import time
 
 class AI_Assistant():
 
     FIELDS_SEPARATOR = "|/="
+    # Peso de la última medición en la media móvil del tiempo de respuesta
+    RESPONSE_TIME_SMOOTHING = 0.3
 
     def __init__(self, initial_prompt: str, personalities_path: str, personality_name: str, summarization_frequency: int, auto_save: bool, lm_params: tuple):
         '''
@@ -44,6 +47,8 @@ class AI_Assistant():
         self.summarization_frequency = summarization_frequency
         self.summarization_counter = 0
         self.auto_save = auto_save
+        # Estimación del tiempo de respuesta del modelo (segundos). None -> sin mediciones todavía
+        self.response_time_estimate = None
         
         # Configurar el directorio de personalidades
         self.personalities_path = personalities_path
@@ -73,11 +78,13 @@ class AI_Assistant():
 
         self.conversation_history.append({"role": "user", "content": message})
         try:
+            start_time = time.perf_counter()
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=self.conversation_history
             )
             ai_response = completion.choices[0].message.content
+            self.update_response_time(time.perf_counter() - start_time)
 
             self.conversation_history.append({"role": "assistant", "content": ai_response})
 
@@ -94,6 +101,22 @@ class AI_Assistant():
             print(f"Error: {str(e)}")
             return None
         
+    def update_response_time(self, elapsed: float):
+        '''
+        Actualiza la media móvil exponencial del tiempo de respuesta del modelo.
+        '''
+        if self.response_time_estimate is None:
+            self.response_time_estimate = elapsed
+        else:
+            alpha = self.RESPONSE_TIME_SMOOTHING
+            self.response_time_estimate = alpha * elapsed + (1 - alpha) * self.response_time_estimate
+
+    def predicted_response_time(self):
+        '''
+        Devuelve el tiempo de respuesta previsto (segundos) o None si aún no hay mediciones.
+        '''
+        return self.response_time_estimate
+
     def perform_summarization(self, save: bool):
         try:
             text = "Hazte un resumen mínimo de los aspectos más relevantes de la conversación que has mantenido actualmente y lo aprendido en conversaciones anteriores, con el fin de poder recordarlos más adelante."